@@ -0,0 +1,162 @@
+import sys
+import io
+import json
+import time
+import random
+import tracemalloc
+
+from fast_json import loads, BACKEND, iter_trades, project
+from run_once import TRADE_FIELDS
+
+# Usage:
+#   python bench_decode.py                      -> synthetic 500-trade page + Gamma event
+#   python bench_decode.py trades.json ...      -> recorded payloads (e.g. saved with curl)
+#   python bench_decode.py --record DIR         -> save live payloads to DIR, then benchmark them
+
+EVENT_SLUG = "us-strikes-iran-by"
+GAMMA_EVENTS = "https://gamma-api.polymarket.com/events"
+DATA_TRADES = "https://data-api.polymarket.com/trades"
+
+REPEAT = 20
+
+def fake_trade(i: int) -> dict:
+    # Same shape as a Data API /trades row
+    rnd = random.Random(i)
+    return {
+        "proxyWallet": "0x" + "%040x" % rnd.getrandbits(160),
+        "side": rnd.choice(["BUY", "SELL"]),
+        "asset": str(rnd.getrandbits(250)),
+        "conditionId": "0x" + "%064x" % rnd.getrandbits(256),
+        "size": round(rnd.uniform(1, 2_000_000), 6),
+        "price": round(rnd.random(), 3),
+        "timestamp": 1760000000 + i * 37,
+        "title": "US strikes Iran by ...?",
+        "slug": f"us-strikes-iran-by-{i % 40}",
+        "icon": "https://polymarket-upload.s3.us-east-2.amazonaws.com/us-strikes-iran.png",
+        "eventSlug": EVENT_SLUG,
+        "outcome": rnd.choice(["Yes", "No"]),
+        "outcomeIndex": rnd.randint(0, 1),
+        "name": f"trader{i}",
+        "pseudonym": "Some-Random-Pseudonym",
+        "bio": "",
+        "profileImage": "",
+        "profileImageOptimized": "",
+        "transactionHash": "0x" + "%064x" % rnd.getrandbits(256),
+    }
+
+def fake_event(n_markets: int = 60) -> list:
+    markets = []
+    for i in range(n_markets):
+        markets.append({
+            "id": str(500000 + i),
+            "question": f"US strikes Iran by day {i}?",
+            "conditionId": "0x" + "%064x" % random.Random(i).getrandbits(256),
+            "slug": f"us-strikes-iran-by-{i}",
+            "endDate": "2026-%02d-%02dT12:00:00Z" % (1 + i % 12, 1 + i % 28),
+            "description": "This market will resolve to \"Yes\" if ... " * 20,
+            "outcomes": "[\"Yes\", \"No\"]",
+            "outcomePrices": "[\"0.12\", \"0.88\"]",
+            "clobTokenIds": json.dumps([str(random.Random(i).getrandbits(250)) for _ in range(2)]),
+            "volume": "123456.78",
+            "liquidity": "9876.54",
+        })
+    return [{"id": "1", "slug": EVENT_SLUG, "title": "US strikes Iran by...?", "markets": markets}]
+
+def record(out_dir: str) -> list:
+    import os
+    import requests
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, url, params in [
+        ("trades_500.json", DATA_TRADES, {"limit": 500}),
+        ("gamma_event.json", GAMMA_EVENTS, {"slug": [EVENT_SLUG], "limit": 10}),
+    ]:
+        r = requests.get(url, params=params, timeout=20)
+        r.raise_for_status()
+        path = os.path.join(out_dir, name)
+        with open(path, "wb") as f:
+            f.write(r.content)
+        paths.append(path)
+    return paths
+
+class _Body:
+    # Stands in for a streamed requests.Response
+    def __init__(self, payload: bytes):
+        self.raw = io.BytesIO(payload)
+
+    def iter_content(self, chunk_size):
+        while True:
+            b = self.raw.read(chunk_size)
+            if not b:
+                return
+            yield b
+
+# Every strategy reads the body from a file-like source, like a socket,
+# so the raw bytes held by the full parsers count towards their peak.
+def full_stdlib(payload: bytes):
+    data = json.loads(_Body(payload).raw.read())
+    return [project(t, TRADE_FIELDS) for t in data]
+
+def full_fast(payload: bytes):
+    data = loads(_Body(payload).raw.read())
+    return [project(t, TRADE_FIELDS) for t in data]
+
+def streaming(payload: bytes):
+    return list(iter_trades(_Body(payload), TRADE_FIELDS))
+
+def measure(fn, payload: bytes):
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn(payload)
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def bench(name: str, payload: bytes):
+    strategies = [("json (full)", full_stdlib), (f"{BACKEND} (full)", full_fast)]
+    # Streaming only applies to arrays of trades, not Gamma events
+    data = json.loads(payload)
+    if not (data and isinstance(data[0], dict) and "markets" in data[0]):
+        strategies.append(("streaming + projection", streaming))
+
+    print(f"\n{name}: {len(payload) / 1024:,.0f} KiB")
+    base_t, base_m = None, None
+    for label, fn in strategies:
+        t, m = measure(fn, payload)
+        if base_t is None:
+            base_t, base_m = t, m
+        print(
+            f"  {label:<24} {t * 1000:8.2f} ms  x{base_t / t:5.2f}   "
+            f"peak {m / 1024:9,.0f} KiB  x{base_m / m:5.2f}"
+        )
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["--record"]:
+        args = record(args[1] if len(args) > 1 else "payloads")
+
+    if args:
+        payloads = []
+        for path in args:
+            with open(path, "rb") as f:
+                payloads.append((path, f.read()))
+    else:
+        payloads = [
+            ("synthetic poll (300)", json.dumps([fake_trade(i) for i in range(300)]).encode()),
+            ("synthetic trades page (500)", json.dumps([fake_trade(i) for i in range(500)]).encode()),
+            ("synthetic catch-up (5 x 500)", json.dumps([fake_trade(i) for i in range(2500)]).encode()),
+            ("synthetic Gamma event", json.dumps(fake_event()).encode()),
+        ]
+
+    print(f"fast backend: {BACKEND}, best of {REPEAT} runs, peak via tracemalloc")
+    for name, payload in payloads:
+        bench(name, payload)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+# Measures how long run_once.py takes from process start to its first trade
+# fetch, without a run snapshot (cold) and with one (fast start).
+#
+# Usage:
+#   python bench_startup.py                    -> offline: Gamma answers from a local payload
+#   python bench_startup.py gamma_event.json   -> offline, with a recorded Gamma payload
+#                                                 (e.g. from bench_decode.py --record)
+#   python bench_startup.py --online           -> real Gamma round-trip (needs network + requests)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPEAT = 15
+
+# Runs inside the child process: stop at the trade fetch, never send Telegram messages
+CHILD = r"""
+import sys, types
+sys.path.insert(0, {here!r})
+payload = {payload!r}
+prime = {prime!r}
+if payload:
+    # Offline: answer the Gamma request from a local file
+    class _Resp:
+        def __init__(self, path):
+            with open(path, "rb") as f:
+                self.content = f.read()
+        def raise_for_status(self):
+            pass
+    fake = types.ModuleType("requests")
+    fake.get = lambda *a, **k: _Resp(payload)
+    sys.modules["requests"] = fake
+
+import run_once
+
+class _Reached(Exception):
+    pass
+
+def _first_fetch(*a, **k):
+    raise _Reached()
+
+# The priming run completes (no trades) so it writes state.json + run_snapshot.json
+run_once.fetch_big_trades = (lambda *a, **k: []) if prime else _first_fetch
+run_once.tg_send = lambda text: None
+try:
+    run_once.main()
+except _Reached:
+    pass
+"""
+
+def default_payload(tmp: str) -> str:
+    from bench_decode import fake_event
+
+    ev = fake_event()
+    # Make every market still active so the run gets to the trade fetch
+    for m in ev[0]["markets"]:
+        m["endDate"] = "2099-01-01T00:00:00Z"
+    path = os.path.join(tmp, "gamma_event.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(ev, f)
+    return path
+
+def run_child(tmp: str, code: str) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+def main():
+    args = sys.argv[1:]
+    online = "--online" in args
+    args = [a for a in args if a != "--online"]
+
+    tmp = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        payload = None
+        if not online:
+            payload = os.path.abspath(args[0]) if args else default_payload(tmp)
+        code = CHILD.format(here=HERE, payload=payload, prime=False)
+
+        state_path = os.path.join(tmp, "state.json")
+        snap_path = os.path.join(tmp, "run_snapshot.json")
+
+        # Prime state.json + run_snapshot.json with one full run (this one marks the daily ping)
+        run_child(tmp, CHILD.format(here=HERE, payload=payload, prime=True))
+        with open(state_path, "rb") as f:
+            state = f.read()
+        with open(snap_path, "rb") as f:
+            snap = f.read()
+
+        results = {}
+        for label, with_snapshot in [("cold (no snapshot)", False), ("fast start (snapshot)", True)]:
+            best = float("inf")
+            for _ in range(REPEAT):
+                with open(state_path, "wb") as f:
+                    f.write(state)
+                if with_snapshot:
+                    with open(snap_path, "wb") as f:
+                        f.write(snap)
+                elif os.path.exists(snap_path):
+                    os.remove(snap_path)
+                best = min(best, run_child(tmp, code))
+            results[label] = best
+
+        print(f"time to first trade fetch, best of {REPEAT} ({'online' if online else 'offline'})")
+        cold = results["cold (no snapshot)"]
+        for label, t in results.items():
+            print(f"  {label:<24} {t * 1000:8.1f} ms  x{cold / t:5.2f}")
+
+        # Python startup alone, for reference
+        t = min(run_child(tmp, "pass") for _ in range(REPEAT))
+        print(f"  {'bare interpreter':<24} {t * 1000:8.1f} ms")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
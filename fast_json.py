@@ -0,0 +1,127 @@
+import re
+import json
+import codecs
+
+# Pick the fastest JSON backend that is installed (orjson > ujson > stdlib json).
+try:
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson
+
+        def loads(data):
+            return ujson.loads(data)
+
+        BACKEND = "ujson"
+    except ImportError:
+        loads = json.loads
+        BACKEND = "json"
+
+CHUNK_SIZE = 64 * 1024
+
+# Trade pages this long (daily summary / recap / catch-up) are streamed.
+# Streaming only saves memory: it is slower than a full parse with the fast
+# backend, so the regular small polls go through decode_trades() instead.
+STREAM_MIN_ROWS = 500
+
+_WS = re.compile(r"[ \t\n\r]*")
+_SEP = re.compile(r"[ \t\n\r]*,[ \t\n\r]*")
+_DELIMS = " \t\n\r,]"
+_scanner = json.JSONDecoder().scan_once
+
+def decode(r):
+    # Parse a whole requests.Response body with the fast backend (replacement for r.json())
+    return loads(r.content)
+
+def project(obj, fields):
+    if not isinstance(obj, dict):
+        return obj
+    return {k: obj[k] for k in fields if k in obj}
+
+def iter_array(chunks):
+    """
+    Incrementally parses a top-level JSON array from an iterable of byte chunks,
+    yielding one element at a time. Only the current chunk and the element
+    being decoded are held in memory, never the whole body.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    scan = _scanner
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def more():
+        nonlocal buf, pos, eof
+        for chunk in chunks:
+            if chunk:
+                buf = buf[pos:] + utf8.decode(chunk)
+                pos = 0
+                return True
+        buf = buf[pos:] + utf8.decode(b"", final=True)
+        pos = 0
+        eof = True
+        return False
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if pos < len(buf) or eof or not more():
+                return
+
+    skip_ws()
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("expected a JSON array")
+    pos += 1
+
+    first = True
+    while True:
+        # Fast path: "<ws>,<ws>" fully in the buffer, go straight to the next element
+        m = _SEP.match(buf, pos) if not first else None
+        if m and m.end() < len(buf):
+            pos = m.end()
+        else:
+            skip_ws()
+            if pos >= len(buf):
+                raise ValueError("unterminated JSON array")
+            if buf[pos] == "]":
+                return
+            if not first:
+                if buf[pos] != ",":
+                    raise ValueError("expected ',' or ']' between array elements")
+                pos += 1
+                skip_ws()
+        first = False
+
+        while True:
+            try:
+                item, end = scan(buf, pos)
+            except (json.JSONDecodeError, StopIteration):
+                # Element is split across chunks: pull more data and retry
+                if eof or not more():
+                    raise ValueError("invalid or truncated JSON array element")
+                continue
+            # A number cut by a chunk boundary decodes short ("12" of "125",
+            # "1" of "1e5"), so only accept an element once its delimiter is in
+            if not eof and (end == len(buf) or buf[end] not in _DELIMS):
+                more()
+                continue
+            break
+        pos = end
+        yield item
+
+def decode_trades(r, fields):
+    # Full parse with the fast backend, keeping only the given fields of each trade
+    return [project(t, fields) for t in decode(r)]
+
+def iter_trades(r, fields):
+    # Streams trades out of a requests.Response (opened with stream=True),
+    # keeping only the given fields of each trade.
+    for t in iter_array(r.iter_content(chunk_size=CHUNK_SIZE)):
+        yield project(t, fields)
@@ -1,16 +1,39 @@
-import os, json, requests
+import os, json, time
 from datetime import datetime, timezone, timedelta
-from zoneinfo import ZoneInfo
+from fast_json import decode, decode_trades, iter_trades, STREAM_MIN_ROWS
+
+# requests and zoneinfo are imported lazily: a cron run with a fresh
+# snapshot only needs them once it actually fetches trades / sends messages.
 
 EVENT_SLUG = "us-strikes-iran-by"
 GAMMA_EVENTS = "https://gamma-api.polymarket.com/events"
 DATA_TRADES = "https://data-api.polymarket.com/trades"
 STATE_FILE = "state.json"
+SNAPSHOT_FILE = "run_snapshot.json"
+
+# Trade fields read by the filters and the alert/summary messages
+TRADE_FIELDS = ("eventSlug", "conditionId", "timestamp", "outcome", "side", "price", "size", "transactionHash")
 
 GRACE_HOURS = 2
-ISRAEL_TZ = ZoneInfo("Asia/Jerusalem")
+SNAPSHOT_VERSION = 1
+# Re-fetch the market list from Gamma at most once an hour. A market added to
+# the event in between is only picked up at the next refresh, so its alerts can
+# arrive up to this late; they are not lost, because on refresh trades on
+# markets missing from the snapshot are looked up back to the snapshot's fetch
+# time instead of the shared last_ts watermark (see main()).
+MARKETS_TTL_SEC = 3600
+
+_israel_tz = None
+
+def israel_tz():
+    global _israel_tz
+    if _israel_tz is None:
+        from zoneinfo import ZoneInfo
+        _israel_tz = ZoneInfo("Asia/Jerusalem")
+    return _israel_tz
 
 def tg_send(text: str):
+    import requests
     token = os.environ["TELEGRAM_BOT_TOKEN"].strip()
     chat_id = os.environ["TELEGRAM_CHAT_ID"].strip()
     url = f"https://api.telegram.org/bot{token}/sendMessage"
@@ -18,17 +41,17 @@ def tg_send(text: str):
     r.raise_for_status()
     
 def is_israel_time_to_send_summary() -> bool:
-    now_il = datetime.now(timezone.utc).astimezone(ISRAEL_TZ)
+    now_il = datetime.now(timezone.utc).astimezone(israel_tz())
     return now_il.hour == 9
     
 def parse_iso_z(s: str):
     return datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
 
 def now_israel_date_str() -> str:
-    return datetime.now(timezone.utc).astimezone(ISRAEL_TZ).strftime("%Y-%m-%d")
+    return datetime.now(timezone.utc).astimezone(israel_tz()).strftime("%Y-%m-%d")
 
 def format_israel_time(ts: int) -> str:
-    dt = datetime.fromtimestamp(int(ts), tz=timezone.utc).astimezone(ISRAEL_TZ)
+    dt = datetime.fromtimestamp(int(ts), tz=timezone.utc).astimezone(israel_tz())
     return dt.strftime("%Y-%m-%d %H:%M:%S Israel")
 
 def should_send_daily(state: dict, key: str) -> bool:
@@ -39,9 +62,10 @@ def mark_daily(state: dict, key: str):
     state[key] = now_israel_date_str()
 
 def fetch_active_markets():
+    import requests
     r = requests.get(GAMMA_EVENTS, params={"slug": [EVENT_SLUG], "limit": 10}, timeout=20)
     r.raise_for_status()
-    events = r.json()
+    events = decode(r)
     ev = events[0]
     title = ev.get("title") or EVENT_SLUG
 
@@ -63,6 +87,7 @@ def fetch_active_markets():
                 "slug": m.get("slug"),
                 "question": m.get("question"),
                 "endDate": end_s,
+                "end_ts": int(end_dt.timestamp()),
             }
     return title, markets
 
@@ -88,14 +113,90 @@ def save_state(state: dict):
     with open(STATE_FILE, "w", encoding="utf-8") as f:
         json.dump(state, f)
 
+def next_daily_deadlines(state: dict):
+    """
+    Unix times at which the daily ping and the 09:00 summary next become due,
+    so runs in between can skip the Israel-time checks entirely.
+    """
+    tz = israel_tz()
+    now_il = datetime.now(timezone.utc).astimezone(tz)
+    today = now_il.date()
+    tomorrow = today + timedelta(days=1)
+
+    def at(day, hour):
+        return int(datetime(day.year, day.month, day.day, hour, tzinfo=tz).timestamp())
+
+    if should_send_daily(state, "last_alive_date"):
+        next_alive_ts = 0
+    else:
+        next_alive_ts = at(tomorrow, 0)
+
+    if now_il.hour < 9 or (now_il.hour == 9 and should_send_daily(state, "last_summary_date")):
+        next_summary_ts = at(today, 9)
+    else:
+        next_summary_ts = at(tomorrow, 9)
+
+    return next_alive_ts, next_summary_ts
+
+def load_snapshot(state: dict):
+    """
+    Returns the previous run's snapshot if it can be trusted for this run
+    (same event, same watermark, well-formed). The caller checks markets_ts
+    against MARKETS_TTL_SEC: an expired snapshot still tells which markets
+    were already being watched.
+    """
+    try:
+        with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            snap = json.load(f)
+    except Exception:
+        return None
+    if not isinstance(snap, dict) or snap.get("version") != SNAPSHOT_VERSION:
+        return None
+    if snap.get("event_slug") != EVENT_SLUG or snap.get("last_ts") != int(state.get("last_ts", 0)):
+        return None
+    # Anything main() reads must be there with the right type, else start cold
+    if not isinstance(snap.get("title"), str):
+        return None
+    if not all(isinstance(snap.get(k), int) for k in ("markets_ts", "next_alive_ts", "next_summary_ts")):
+        return None
+    markets = snap.get("markets")
+    if not isinstance(markets, dict):
+        return None
+    if not all(isinstance(m, dict) and isinstance(m.get("end_ts"), int) for m in markets.values()):
+        return None
+    return snap
+
+def save_snapshot(state: dict, title: str, markets: dict, markets_ts: int, deadlines):
+    snap = {
+        "version": SNAPSHOT_VERSION,
+        "event_slug": EVENT_SLUG,
+        "title": title,
+        "markets_ts": markets_ts,
+        "markets": markets,
+        "last_ts": int(state.get("last_ts", 0)),
+        "next_alive_ts": deadlines[0],
+        "next_summary_ts": deadlines[1],
+    }
+    with open(SNAPSHOT_FILE, "w", encoding="utf-8") as f:
+        json.dump(snap, f, separators=(",", ":"))
+
+def active_snapshot_markets(snap: dict) -> dict:
+    # Same GRACE_HOURS cutoff as fetch_active_markets, on the pre-parsed end times
+    cutoff_ts = int(time.time()) - GRACE_HOURS * 3600
+    return {cid: m for cid, m in snap["markets"].items() if m.get("end_ts", 0) >= cutoff_ts}
+
 def fetch_big_trades(condition_ids, threshold, limit=300):
+    import requests
     params = {
         "limit": limit,
         "market": ",".join(condition_ids),
         "filterType": "CASH",
         "filterAmount": threshold,
     }
-    return requests.get(DATA_TRADES, params=params, timeout=20).json()
+    # Large pages are streamed to cap memory; regular polls parse faster in one go
+    stream = limit >= STREAM_MIN_ROWS
+    with requests.get(DATA_TRADES, params=params, timeout=20, stream=stream) as r:
+        yield from iter_trades(r, TRADE_FIELDS) if stream else decode_trades(r, TRADE_FIELDS)
 
 def send_daily_summary(markets: dict, threshold: float):
     """
@@ -154,25 +255,47 @@ def main():
 
     state = load_state()
 
-    # Fetch markets once per run
-    title, markets = fetch_active_markets()
+    # Fast start: reuse the last run's market list and daily deadlines if still valid
+    snap = load_snapshot(state)
+    fresh = snap and time.time() - snap["markets_ts"] < MARKETS_TTL_SEC
+    markets = active_snapshot_markets(snap) if fresh else {}
+    new_since = {}
+    if markets:
+        title = snap["title"]
+        markets_ts = snap["markets_ts"]
+    else:
+        title, markets = fetch_active_markets()
+        markets_ts = int(time.time())
+        if snap:
+            # Markets added since the snapshot were never queried, while last_ts
+            # kept advancing on the others: look back to the snapshot's fetch time
+            new_since = {cid: snap["markets_ts"] for cid in markets if cid not in snap["markets"]}
+        snap = None
+
     condition_ids = list(markets.keys())
     if not condition_ids:
         print("No active markets found.")
         return
 
-    # A) Daily "still alive" (once per Israel day)
-    if should_send_daily(state, "last_alive_date"):
-        tg_send(f"✅ Polymarket watcher is alive (daily ping). Event: {title}")
-        mark_daily(state, "last_alive_date")
+    now_ts = int(time.time())
+    if snap and now_ts < snap["next_alive_ts"] and now_ts < snap["next_summary_ts"]:
+        # Nothing daily is due before the next deadline
+        deadlines = (snap["next_alive_ts"], snap["next_summary_ts"])
+    else:
+        # A) Daily "still alive" (once per Israel day)
+        if should_send_daily(state, "last_alive_date"):
+            tg_send(f"✅ Polymarket watcher is alive (daily ping). Event: {title}")
+            mark_daily(state, "last_alive_date")
 
-    # B) Daily summary (only at 09:00 Israel time, once per Israel day)
-    if is_israel_time_to_send_summary() and should_send_daily(state, "last_summary_date"):
-        try:
-            send_daily_summary(markets, threshold)
-        except Exception as e:
-            tg_send(f"⚠️ Daily summary failed: {e}")
-        mark_daily(state, "last_summary_date")
+        # B) Daily summary (only at 09:00 Israel time, once per Israel day)
+        if is_israel_time_to_send_summary() and should_send_daily(state, "last_summary_date"):
+            try:
+                send_daily_summary(markets, threshold)
+            except Exception as e:
+                tg_send(f"⚠️ Daily summary failed: {e}")
+            mark_daily(state, "last_summary_date")
+
+        deadlines = next_daily_deadlines(state)
 
 
     last_ts = int(state.get("last_ts", 0))
@@ -191,7 +314,7 @@ def main():
             continue
 
         t_ts = int(t.get("timestamp") or 0)
-        if t_ts <= last_ts:
+        if t_ts <= min(last_ts, new_since.get(cid, last_ts)):
             continue
 
         if not increases_yes_exposure(t):
@@ -220,6 +343,7 @@ def main():
     # Save state (IMPORTANT: keep daily keys too)
     state["last_ts"] = newest_ts
     save_state(state)
+    save_snapshot(state, title, markets, markets_ts, deadlines)
 
     print(f"Done. last_ts was {last_ts}, now {newest_ts}. Sent {len(hits)} alerts.")
 
@@ -2,6 +2,7 @@ import os
 import time
 import requests
 from dotenv import load_dotenv
+from fast_json import decode, decode_trades, iter_trades, STREAM_MIN_ROWS
 
 load_dotenv()
 
@@ -10,6 +11,9 @@ EVENT_SLUG = "us-strikes-iran-by"
 GAMMA_EVENTS = "https://gamma-api.polymarket.com/events"
 DATA_TRADES = "https://data-api.polymarket.com/trades"
 
+# Trade fields read by the filter, the alert message and trade_unique_id()
+TRADE_FIELDS = ("id", "market", "conditionId", "timestamp", "price", "size", "side", "asset")
+
 def tg_send(text: str):
     token = os.environ["TELEGRAM_BOT_TOKEN"].strip()
     chat_id = os.environ["TELEGRAM_CHAT_ID"].strip()
@@ -26,7 +30,7 @@ def notional_usd(trade: dict) -> float:
 def fetch_event_markets():
     r = requests.get(GAMMA_EVENTS, params={"slug": [EVENT_SLUG], "limit": 10}, timeout=20)
     r.raise_for_status()
-    events = r.json()
+    events = decode(r)
     if not events:
         raise RuntimeError(f"No event found for slug={EVENT_SLUG}")
     ev = events[0]
@@ -46,9 +50,10 @@ def fetch_event_markets():
 
 def fetch_latest_trades(limit=200):
     # Pull latest trades across the platform and filter locally (efficient for 42 markets).
-    r = requests.get(DATA_TRADES, params={"limit": limit}, timeout=20)
-    r.raise_for_status()
-    return r.json()
+    stream = limit >= STREAM_MIN_ROWS
+    with requests.get(DATA_TRADES, params={"limit": limit}, timeout=20, stream=stream) as r:
+        r.raise_for_status()
+        yield from iter_trades(r, TRADE_FIELDS) if stream else decode_trades(r, TRADE_FIELDS)
 
 def trade_unique_id(t: dict) -> str:
     # Prefer id if present; otherwise build a stable-ish signature
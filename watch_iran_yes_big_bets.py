@@ -3,6 +3,7 @@ import time
 import requests
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
+from fast_json import decode, decode_trades, iter_trades, STREAM_MIN_ROWS
 
 load_dotenv()
 
@@ -14,6 +15,12 @@ DATA_TRADES = "https://data-api.polymarket.com/trades"
 GRACE_HOURS = 2
 REFRESH_MARKETS_EVERY_SEC = 300
 
+# Trade fields read by the filters, the messages and trade_uid()
+TRADE_FIELDS = (
+    "eventSlug", "conditionId", "timestamp", "outcome", "side", "price", "size",
+    "transactionHash", "id", "asset",
+)
+
 def tg_send(text: str):
     token = os.environ["TELEGRAM_BOT_TOKEN"].strip()
     chat_id = os.environ["TELEGRAM_CHAT_ID"].strip()
@@ -30,7 +37,7 @@ def unix_now() -> int:
 def fetch_active_markets():
     r = requests.get(GAMMA_EVENTS, params={"slug": [EVENT_SLUG], "limit": 10}, timeout=20)
     r.raise_for_status()
-    events = r.json()
+    events = decode(r)
     if not events:
         raise RuntimeError(f"No event found for slug={EVENT_SLUG}")
     ev = events[0]
@@ -86,7 +93,10 @@ def fetch_big_trades(condition_ids, threshold, limit=200):
         "filterType": "CASH",
         "filterAmount": threshold,
     }
-    return requests.get(DATA_TRADES, params=params, timeout=20).json()
+    # Large pages are streamed to cap memory; regular polls parse faster in one go
+    stream = limit >= STREAM_MIN_ROWS
+    with requests.get(DATA_TRADES, params=params, timeout=20, stream=stream) as r:
+        yield from iter_trades(r, TRADE_FIELDS) if stream else decode_trades(r, TRADE_FIELDS)
 
 def send_24h_recap(markets, condition_ids, threshold):
     now_ts = unix_now()